@@ -2,9 +2,27 @@ import streamlit as st
 import os
 from dotenv import load_dotenv
 import requests
-import json
-from datetime import datetime
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
+try:
+    from orjson import dumps as json_dumps, loads as json_loads, OPT_INDENT_2
+    JSON_INDENT = {'option': OPT_INDENT_2}
+except ImportError:  # orjson wheel unavailable, fall back to the stdlib
+    from json import dumps as json_dumps, loads as json_loads
+    JSON_INDENT = {'indent': 2}
+try:
+    import httpx
+    import h2  # noqa: F401  (required by httpx for http2=True)
+except ImportError:  # HTTP/2 fan-out is optional, fall back to the pooled session
+    httpx = None
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+import heapq
+from html import escape
+import pyarrow as pa
+import pyarrow.compute as pc
 
 # Load environment variables
 load_dotenv()
@@ -18,7 +36,10 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+@st.cache_resource
+def _css():
+    """Static stylesheet, built once per server process"""
+    return """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -53,17 +74,19 @@ st.markdown("""
         margin-bottom: 2rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_css(), unsafe_allow_html=True)
 
 # Initialize session state
-if 'api_key' not in st.session_state:
-    st.session_state.api_key = os.getenv('VAPI_API_KEY', '')
-if 'api_base' not in st.session_state:
-    st.session_state.api_base = os.getenv('VAPI_API_BASE', 'https://api.vapi.ai')
-if 'assistants' not in st.session_state:
-    st.session_state.assistants = []
-if 'selected_assistant' not in st.session_state:
-    st.session_state.selected_assistant = None
+for key, value in {
+    'api_key': os.getenv('VAPI_API_KEY', ''),
+    'api_base': os.getenv('VAPI_API_BASE', 'https://api.vapi.ai'),
+    'assistants': [],
+    'assistants_loaded': False,
+    'selected_assistant': None,
+}.items():
+    st.session_state.setdefault(key, value)
 
 # Sidebar navigation
 st.sidebar.markdown('<div class="sidebar-section">', unsafe_allow_html=True)
@@ -83,55 +106,247 @@ api_status = "✅ Connected" if st.session_state.api_key else "❌ Not configure
 st.sidebar.markdown(f"**Status:** {api_status}")
 st.sidebar.markdown('</div>', unsafe_allow_html=True)
 
+# (connect, read) timeout in seconds, so a hung connection cannot stall the script thread
+REQUEST_TIMEOUT = (3.05, 10)
+SUCCESS_STATUSES = (200, 201, 204)
+TIMEOUT_MESSAGE = "Connection Error: VAPI AI did not respond in time. Please try again."
+
 # Helper functions
+@st.cache_resource(max_entries=8)
+def get_session(api_key):
+    """Shared HTTP session per API key so keep-alive connections are reused across reruns"""
+    session = requests.Session()
+    session.headers.update({
+        'Authorization': f'Bearer {api_key}',
+        'Content-Type': 'application/json'
+    })
+    retry = Retry(
+        total=2,
+        connect=2,
+        read=1,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        # POST is left out: retrying a create could duplicate the assistant
+        allowed_methods=frozenset(['GET', 'PATCH', 'DELETE']),
+        # Hand back the last 5xx response instead of raising RetryError
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+def connection_error_message(error):
+    """User-facing text for a request failure, treating retried-out read timeouts as timeouts"""
+    # With read retries mounted, a final read timeout surfaces as ConnectionError(MaxRetryError)
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    if isinstance(error, requests.Timeout) or isinstance(reason, ReadTimeoutError):
+        return TIMEOUT_MESSAGE
+    return f"Connection Error: {str(error)}"
+
 def make_api_request(method, endpoint, data=None):
     """Make API request to VAPI AI"""
     if not st.session_state.api_key:
         st.error("API key not configured. Please go to Settings.")
         return None
     
-    headers = {
-        'Authorization': f'Bearer {st.session_state.api_key}',
-        'Content-Type': 'application/json'
-    }
-    
     url = f"{st.session_state.api_base}{endpoint}"
     
     try:
-        if method == 'GET':
-            response = requests.get(url, headers=headers)
-        elif method == 'POST':
-            response = requests.post(url, headers=headers, json=data)
-        elif method == 'PATCH':
-            response = requests.patch(url, headers=headers, json=data)
-        elif method == 'DELETE':
-            response = requests.delete(url, headers=headers)
+        body = json_dumps(data) if data is not None else None
+        response = get_session(st.session_state.api_key).request(method, url, data=body, timeout=REQUEST_TIMEOUT)
         
-        if response.status_code in [200, 201]:
-            return response.json()
+        if response.status_code in SUCCESS_STATUSES:
+            # 204 (and any other empty body) means success with nothing to decode
+            return json_loads(response.content) if response.content else {}
         else:
             st.error(f"API Error: {response.status_code} - {response.text}")
             return None
+    except (requests.Timeout, requests.ConnectionError) as e:
+        st.error(connection_error_message(e))
+        return None
     except Exception as e:
         st.error(f"Connection Error: {str(e)}")
         return None
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_assistants(api_key, api_base):
+    """Fetch the assistant list, cached until it expires or a write clears it"""
+    response = get_session(api_key).get(f"{api_base}/assistant", timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return json_loads(response.content)
+
 def load_assistants():
     """Load assistants from VAPI AI API"""
-    assistants = make_api_request('GET', '/assistant')
-    if assistants:
-        st.session_state.assistants = assistants
-        return assistants
-    return []
+    if not st.session_state.api_key:
+        st.error("API key not configured. Please go to Settings.")
+        return None
+    
+    try:
+        assistants = _fetch_assistants(st.session_state.api_key, st.session_state.api_base)
+    except requests.HTTPError as e:
+        st.error(f"API Error: {e.response.status_code} - {e.response.text}")
+        return None
+    except (requests.Timeout, requests.ConnectionError) as e:
+        st.error(connection_error_message(e))
+        return None
+    except Exception as e:
+        st.error(f"Connection Error: {str(e)}")
+        return None
+    
+    st.session_state.assistants = assistants
+    st.session_state.assistants_loaded = True
+    return assistants
+
+def merge_assistant(assistant):
+    """Insert or replace one assistant in the local list after a successful write"""
+    _fetch_assistants.clear()
+    if not st.session_state.assistants_loaded:
+        # Merging into a list that was never fetched would hide everyone else's assistants
+        load_assistants()
+        return
+    by_id = {a['id']: a for a in st.session_state.assistants}
+    by_id[assistant['id']] = assistant
+    st.session_state.assistants = list(by_id.values())
+
+def remove_assistant(assistant_id):
+    """Drop one assistant from the local list after a successful delete"""
+    _fetch_assistants.clear()
+    if not st.session_state.assistants_loaded:
+        load_assistants()
+        return
+    st.session_state.assistants = [a for a in st.session_state.assistants if a['id'] != assistant_id]
+
+@st.cache_resource(max_entries=8)
+def get_http2_client(api_key):
+    """HTTP/2 client per API key; concurrent requests share one multiplexed connection"""
+    return httpx.Client(
+        headers={
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        },
+        timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+        # Retries failed connects, like the session adapter's connect retries
+        transport=httpx.HTTPTransport(http2=True, retries=2)
+    )
+
+def fan_out(calls):
+    """
+    Run independent (method, url) requests concurrently, over HTTP/2 when httpx is installed
+    
+    Returns the decoded body of each call in order, or None for any call that
+    failed, whichever HTTP client sent it.
+    """
+    if httpx is not None:
+        client = get_http2_client(st.session_state.api_key)
+        send = lambda call: client.request(*call)
+        transport_errors = httpx.HTTPError
+    else:
+        session = get_session(st.session_state.api_key)
+        send = lambda call: session.request(*call, timeout=REQUEST_TIMEOUT)
+        transport_errors = requests.RequestException
+    
+    def fetch(call):
+        # Runs on a worker thread, so failures are returned rather than shown with st.error
+        try:
+            response = send(call)
+            if response.status_code not in SUCCESS_STATUSES:
+                return None
+            return json_loads(response.content) if response.content else {}
+        except (transport_errors, ValueError):
+            return None
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        return list(executor.map(fetch, calls))
 
 def format_datetime(dt_string):
     """Format datetime string for display"""
     try:
         dt = datetime.fromisoformat(dt_string.replace('Z', '+00:00'))
+        if dt.tzinfo is not None:
+            # Show offset timestamps in UTC, matching format_datetime_column
+            dt = dt.astimezone(timezone.utc)
         return dt.strftime('%Y-%m-%d %H:%M:%S')
     except:
         return dt_string
 
+@lru_cache(maxsize=8)
+def display_host(url):
+    """API base URL without its scheme, for display"""
+    return url.split('://', 1)[-1]
+
+def assistants_fingerprint(assistants):
+    """Hashable (id, updatedAt) key that changes whenever the assistant list does"""
+    return tuple((a.get('id'), a.get('updatedAt', '')) for a in assistants)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def pretty_json(assistant_id, updated_at, _payload):
+    """Indented JSON text for an assistant, cached per id and updatedAt"""
+    text = json_dumps(_payload, **JSON_INDENT)
+    return text.decode() if isinstance(text, bytes) else text
+
+def compact(**fields):
+    """Build a dict from keyword arguments, skipping any that are None"""
+    return {k: v for k, v in fields.items() if v is not None}
+
+def build_assistant_payload(name, first_message, first_message_mode, max_duration,
+                            voice_provider, voice_id, voice_speed, voice_stability,
+                            model_provider, model_name, temperature, max_tokens, system_message,
+                            background_sound, end_call_message, voicemail_message, end_call_phrases):
+    """Assistant payload shared by the Create and Edit forms, with empty fields left out"""
+    return compact(
+        name=name,
+        firstMessage=first_message or None,
+        firstMessageMode=first_message_mode,
+        maxDurationSeconds=max_duration,
+        voice=compact(
+            provider=voice_provider,
+            voiceId=voice_id or None,
+            speed=voice_speed,
+            stability=voice_stability
+        ),
+        model=compact(
+            provider=model_provider,
+            model=model_name or None,
+            temperature=temperature,
+            maxTokens=max_tokens,
+            messages=[{"role": "system", "content": system_message}] if system_message else None
+        ),
+        backgroundSound=background_sound,
+        endCallMessage=end_call_message or None,
+        voicemailMessage=voicemail_message or None,
+        endCallPhrases=list(filter(None, (phrase.strip() for phrase in end_call_phrases.split('\n')))) or None
+    )
+
+def format_datetime_column(values):
+    """Vectorized format_datetime for a list of ISO datetime strings"""
+    strings = pa.array(values, pa.string())
+    # Blank values become nulls (rendered as '') so one missing date doesn't force the fallback
+    strings = pc.if_else(pc.equal(strings, ''), pa.scalar(None, pa.string()), strings)
+    try:
+        parsed = pc.cast(strings, pa.timestamp('us', tz='UTC'))
+        parsed = pc.cast(parsed, pa.timestamp('s', tz='UTC'), safe=False)
+        return pc.fill_null(pc.strftime(parsed, format='%Y-%m-%d %H:%M:%S'), '')
+    except pa.ArrowInvalid:
+        # Some value is not ISO 8601; fall back to per-value formatting
+        return pa.array([format_datetime(v) for v in values], pa.string())
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def build_assistants_table(fingerprint, _assistants):
+    """Build the assistants table as an Arrow table once per distinct assistants payload"""
+    return pa.table({
+        'Name': [a.get('name', 'Unnamed') for a in _assistants],
+        'ID': [a.get('id', 'N/A') for a in _assistants],
+        'Created': format_datetime_column([a.get('createdAt', '') for a in _assistants]),
+        'Updated': format_datetime_column([a.get('updatedAt', '') for a in _assistants]),
+        'First Message': [a['firstMessage'][:50] + '...' if a.get('firstMessage') else 'N/A' for a in _assistants]
+    })
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_recent_assistants(fingerprint, _assistants, count=5):
+    """Most recently updated assistants, cached per distinct assistants payload"""
+    return heapq.nlargest(count, _assistants, key=lambda x: x.get('updatedAt', ''))
+
 # Main content based on selected page
 if page == "🏠 Dashboard":
     st.markdown('<h1 class="main-header">VAPI AI Assistant Manager</h1>', unsafe_allow_html=True)
@@ -143,35 +358,30 @@ if page == "🏠 Dashboard":
     
     with col2:
         if st.button("🔄 Refresh Assistants"):
+            _fetch_assistants.clear()
             load_assistants()
         st.metric("Total Assistants", len(st.session_state.assistants))
     
     with col3:
-        st.metric("API Base", st.session_state.api_base.replace('https://', ''))
+        st.metric("API Base", display_host(st.session_state.api_base))
     
     st.markdown('<div class="section-header">Recent Activity</div>', unsafe_allow_html=True)
     
     if st.session_state.assistants:
         # Show recent assistants
-        recent_assistants = sorted(st.session_state.assistants, 
-                                 key=lambda x: x.get('updatedAt', ''), reverse=True)[:5]
+        recent_assistants = get_recent_assistants(assistants_fingerprint(st.session_state.assistants),
+                                                  st.session_state.assistants)
         
-        for assistant in recent_assistants:
-            with st.container():
-                st.markdown('<div class="assistant-card">', unsafe_allow_html=True)
-                col1, col2, col3 = st.columns([2, 1, 1])
-                
-                with col1:
-                    st.write(f"**{assistant.get('name', 'Unnamed Assistant')}**")
-                    st.write(f"ID: {assistant.get('id', 'N/A')}")
-                
-                with col2:
-                    st.write(f"Created: {format_datetime(assistant.get('createdAt', ''))}")
-                
-                with col3:
-                    st.write(f"Updated: {format_datetime(assistant.get('updatedAt', ''))}")
-                
-                st.markdown('</div>', unsafe_allow_html=True)
+        cards_html = ''.join(
+            f'<div class="assistant-card">'
+            f'<b>{escape(assistant.get("name") or "Unnamed Assistant")}</b><br>'
+            f'ID: {escape(assistant.get("id") or "N/A")}<br>'
+            f'Created: {escape(format_datetime(assistant.get("createdAt") or ""))} | '
+            f'Updated: {escape(format_datetime(assistant.get("updatedAt") or ""))}'
+            f'</div>'
+            for assistant in recent_assistants
+        )
+        st.markdown(cards_html, unsafe_allow_html=True)
     else:
         st.info("No assistants found. Create your first assistant or check your API configuration.")
 
@@ -183,37 +393,40 @@ elif page == "👁️ View Assistants":
         st.markdown('<div class="section-header">Your VAPI AI Assistants</div>', unsafe_allow_html=True)
     with col2:
         if st.button("🔄 Refresh"):
+            _fetch_assistants.clear()
             load_assistants()
     
     # Load assistants if not already loaded
-    if not st.session_state.assistants:
+    if not st.session_state.assistants_loaded:
         load_assistants()
     
     if st.session_state.assistants:
-        # Create a DataFrame for better display
-        assistant_data = []
-        for assistant in st.session_state.assistants:
-            assistant_data.append({
-                'Name': assistant.get('name', 'Unnamed'),
-                'ID': assistant.get('id', 'N/A'),
-                'Created': format_datetime(assistant.get('createdAt', '')),
-                'Updated': format_datetime(assistant.get('updatedAt', '')),
-                'First Message': assistant.get('firstMessage', 'N/A')[:50] + '...' if assistant.get('firstMessage') else 'N/A'
-            })
-        
-        df = pd.DataFrame(assistant_data)
-        st.dataframe(df, use_container_width=True)
+        # Only build and ship the table when the user asks for it
+        if st.toggle("Show table", value=False):
+            table = build_assistants_table(assistants_fingerprint(st.session_state.assistants),
+                                           st.session_state.assistants)
+            
+            # Only ship one page of rows to the frontend
+            page_size = 50
+            page_count = max(1, -(-table.num_rows // page_size))
+            table_page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1,
+                                         help=f"{table.num_rows} assistants, {page_size} per page") if page_count > 1 else 1
+            start = (table_page - 1) * page_size
+            st.dataframe(table.slice(start, page_size), use_container_width=True, hide_index=True)
         
         # Detailed view
         st.markdown('<div class="section-header">Detailed View</div>', unsafe_allow_html=True)
+        by_id = {a['id']: a for a in st.session_state.assistants}
         selected_id = st.selectbox("Select an assistant to view details:", 
-                                  options=[a['id'] for a in st.session_state.assistants],
-                                  format_func=lambda x: next((a['name'] or f"Assistant {x[:8]}..." for a in st.session_state.assistants if a['id'] == x), x))
+                                  options=list(by_id),
+                                  format_func=lambda x: by_id[x].get('name') or f"Assistant {x[:8]}...")
         
         if selected_id:
-            selected_assistant = next((a for a in st.session_state.assistants if a['id'] == selected_id), None)
+            selected_assistant = by_id.get(selected_id)
             if selected_assistant:
-                st.json(selected_assistant)
+                with st.expander("Raw JSON", expanded=False):
+                    st.code(pretty_json(selected_id, selected_assistant.get('updatedAt', ''), selected_assistant),
+                            language='json')
     else:
         st.info("No assistants found. Create your first assistant or check your API configuration.")
 
@@ -288,39 +501,25 @@ elif page == "➕ Create Assistant":
                 st.error("Assistant name is required!")
             else:
                 # Prepare assistant data
-                assistant_data = {
-                    "name": name,
-                    "firstMessage": first_message if first_message else None,
-                    "firstMessageMode": first_message_mode,
-                    "maxDurationSeconds": max_duration,
-                    "voice": {
-                        "provider": voice_provider,
-                        "voiceId": voice_id if voice_id else None,
-                        "speed": voice_speed,
-                        "stability": voice_stability
-                    },
-                    "model": {
-                        "provider": model_provider,
-                        "model": model_name if model_name else None,
-                        "temperature": temperature,
-                        "maxTokens": max_tokens,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": system_message if system_message else "You are a helpful AI assistant."
-                            }
-                        ] if system_message else None
-                    },
-                    "backgroundSound": background_sound,
-                    "endCallMessage": end_call_message if end_call_message else None,
-                    "voicemailMessage": voicemail_message if voicemail_message else None,
-                    "endCallPhrases": [phrase.strip() for phrase in end_call_phrases.split('\n') if phrase.strip()] if end_call_phrases else None
-                }
-                
-                # Remove None values
-                assistant_data = {k: v for k, v in assistant_data.items() if v is not None}
-                assistant_data["voice"] = {k: v for k, v in assistant_data["voice"].items() if v is not None}
-                assistant_data["model"] = {k: v for k, v in assistant_data["model"].items() if v is not None}
+                assistant_data = build_assistant_payload(
+                    name=name,
+                    first_message=first_message,
+                    first_message_mode=first_message_mode,
+                    max_duration=max_duration,
+                    voice_provider=voice_provider,
+                    voice_id=voice_id,
+                    voice_speed=voice_speed,
+                    voice_stability=voice_stability,
+                    model_provider=model_provider,
+                    model_name=model_name,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    system_message=system_message,
+                    background_sound=background_sound,
+                    end_call_message=end_call_message,
+                    voicemail_message=voicemail_message,
+                    end_call_phrases=end_call_phrases
+                )
                 
                 # Create assistant
                 result = make_api_request('POST', '/assistant', assistant_data)
@@ -328,8 +527,8 @@ elif page == "➕ Create Assistant":
                 if result:
                     st.success(f"✅ Assistant '{name}' created successfully!")
                     st.json(result)
-                    # Refresh assistants list
-                    load_assistants()
+                    # Update the local assistants list
+                    merge_assistant(result)
                 else:
                     st.error("Failed to create assistant. Please check your configuration.")
 
@@ -337,17 +536,18 @@ elif page == "✏️ Edit Assistant":
     st.markdown('<h1 class="main-header">Edit Assistant</h1>', unsafe_allow_html=True)
     
     # Load assistants if not already loaded
-    if not st.session_state.assistants:
+    if not st.session_state.assistants_loaded:
         load_assistants()
     
     if st.session_state.assistants:
         # Select assistant to edit
+        by_id = {a['id']: a for a in st.session_state.assistants}
         selected_id = st.selectbox("Select Assistant to Edit:", 
-                                  options=[a['id'] for a in st.session_state.assistants],
-                                  format_func=lambda x: next((a['name'] or f"Assistant {x[:8]}..." for a in st.session_state.assistants if a['id'] == x), x))
+                                  options=list(by_id),
+                                  format_func=lambda x: by_id[x].get('name') or f"Assistant {x[:8]}...")
         
         if selected_id:
-            selected_assistant = next((a for a in st.session_state.assistants if a['id'] == selected_id), None)
+            selected_assistant = by_id.get(selected_id)
             
             if selected_assistant:
                 with st.form("edit_assistant_form"):
@@ -434,50 +634,32 @@ elif page == "✏️ Edit Assistant":
                         end_call_phrases = st.text_area("End Call Phrases (one per line)", 
                                                       value=end_call_phrases_text)
                     
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        submitted = st.form_submit_button("Update Assistant", type="primary")
-                    with col2:
-                        delete_clicked = st.form_submit_button("Delete Assistant", type="secondary")
+                    submitted = st.form_submit_button("Update Assistant", type="primary")
                     
                     if submitted:
                         if not name:
                             st.error("Assistant name is required!")
                         else:
                             # Prepare update data
-                            update_data = {
-                                "name": name,
-                                "firstMessage": first_message if first_message else None,
-                                "firstMessageMode": first_message_mode,
-                                "maxDurationSeconds": max_duration,
-                                "voice": {
-                                    "provider": voice_provider,
-                                    "voiceId": voice_id if voice_id else None,
-                                    "speed": voice_speed,
-                                    "stability": voice_stability
-                                },
-                                "model": {
-                                    "provider": model_provider,
-                                    "model": model_name if model_name else None,
-                                    "temperature": temperature,
-                                    "maxTokens": max_tokens,
-                                    "messages": [
-                                        {
-                                            "role": "system",
-                                            "content": system_message if system_message else "You are a helpful AI assistant."
-                                        }
-                                    ] if system_message else None
-                                },
-                                "backgroundSound": background_sound,
-                                "endCallMessage": end_call_message if end_call_message else None,
-                                "voicemailMessage": voicemail_message if voicemail_message else None,
-                                "endCallPhrases": [phrase.strip() for phrase in end_call_phrases.split('\n') if phrase.strip()] if end_call_phrases else None
-                            }
-                            
-                            # Remove None values
-                            update_data = {k: v for k, v in update_data.items() if v is not None}
-                            update_data["voice"] = {k: v for k, v in update_data["voice"].items() if v is not None}
-                            update_data["model"] = {k: v for k, v in update_data["model"].items() if v is not None}
+                            update_data = build_assistant_payload(
+                                name=name,
+                                first_message=first_message,
+                                first_message_mode=first_message_mode,
+                                max_duration=max_duration,
+                                voice_provider=voice_provider,
+                                voice_id=voice_id,
+                                voice_speed=voice_speed,
+                                voice_stability=voice_stability,
+                                model_provider=model_provider,
+                                model_name=model_name,
+                                temperature=temperature,
+                                max_tokens=max_tokens,
+                                system_message=system_message,
+                                background_sound=background_sound,
+                                end_call_message=end_call_message,
+                                voicemail_message=voicemail_message,
+                                end_call_phrases=end_call_phrases
+                            )
                             
                             # Update assistant
                             result = make_api_request('PATCH', f'/assistant/{selected_id}', update_data)
@@ -485,22 +667,24 @@ elif page == "✏️ Edit Assistant":
                             if result:
                                 st.success(f"✅ Assistant '{name}' updated successfully!")
                                 st.json(result)
-                                # Refresh assistants list
-                                load_assistants()
+                                # Update the local assistants list
+                                merge_assistant(result)
                             else:
                                 st.error("Failed to update assistant. Please check your configuration.")
-                    
-                    if delete_clicked:
-                        st.warning("⚠️ Are you sure you want to delete this assistant?")
-                        if st.button("Yes, Delete Assistant", type="secondary"):
-                            result = make_api_request('DELETE', f'/assistant/{selected_id}')
-                            if result is not None:  # DELETE returns empty response on success
-                                st.success(f"✅ Assistant deleted successfully!")
-                                # Refresh assistants list
-                                load_assistants()
-                                st.rerun()
-                            else:
-                                st.error("Failed to delete assistant.")
+                
+                # Delete sits outside the form so its button can act on the first click
+                st.markdown('<div class="section-header">Delete Assistant</div>', unsafe_allow_html=True)
+                if st.checkbox("Confirm delete", key=f"confirm_delete_{selected_id}"):
+                    st.warning("⚠️ Are you sure you want to delete this assistant?")
+                    if st.button("Delete Assistant", type="secondary"):
+                        result = make_api_request('DELETE', f'/assistant/{selected_id}')
+                        if result is not None:  # DELETE returns empty response on success
+                            st.success(f"✅ Assistant deleted successfully!")
+                            # Update the local assistants list
+                            remove_assistant(selected_id)
+                            st.rerun()
+                        else:
+                            st.error("Failed to delete assistant.")
     else:
         st.info("No assistants found. Create your first assistant or check your API configuration.")
 
@@ -529,13 +713,10 @@ elif page == "⚙️ Settings":
             st.session_state.api_key = api_key
             st.session_state.api_base = api_base
             
-            # Test API connection
+            # Loading assistants with the new settings doubles as the connection test
             if api_key:
-                test_result = make_api_request('GET', '/assistant?limit=1')
-                if test_result is not None:
+                if load_assistants() is not None:
                     st.success("✅ API connection successful!")
-                    # Load assistants with new settings
-                    load_assistants()
                 else:
                     st.error("❌ API connection failed. Please check your API key.")
             else:
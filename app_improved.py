@@ -1,16 +1,94 @@
 import streamlit as st
 import os
+import heapq
+from functools import lru_cache
+from html import escape
 from dotenv import load_dotenv
-import pandas as pd
 from vapi_client import (
     VAPIClient, 
+    APIResult,
     validate_assistant_data, 
     get_assistant_summary,
-    DEFAULT_ASSISTANT_TEMPLATE,
+    new_assistant_template,
     VOICE_PROVIDERS,
     MODEL_PROVIDERS
 )
 
+# Selectbox labels and model lists, computed once at import instead of per rerun
+VOICE_PROVIDER_LABELS = {k: f"{v['name']} - {v['description']}" for k, v in VOICE_PROVIDERS.items()}
+MODEL_PROVIDER_LABELS = {k: f"{v['name']} - {v['description']}" for k, v in MODEL_PROVIDERS.items()}
+MODEL_PROVIDER_MODELS = {k: v['models'] for k, v in MODEL_PROVIDERS.items()}
+
+# Selectbox options with reverse lookups for resolving the current value's index
+MODE_OPTIONS = ("assistant-speaks-first", "assistant-waits-for-user", "assistant-speaks-first-with-model-generated-message")
+BG_SOUND_OPTIONS = ("off", "office", "nature", "cafe")
+VOICE_PROVIDER_OPTIONS = tuple(VOICE_PROVIDERS)
+MODEL_PROVIDER_OPTIONS = tuple(MODEL_PROVIDERS)
+MODE_INDEX = {m: i for i, m in enumerate(MODE_OPTIONS)}
+BG_SOUND_INDEX = {b: i for i, b in enumerate(BG_SOUND_OPTIONS)}
+VOICE_PROVIDER_INDEX = {k: i for i, k in enumerate(VOICE_PROVIDER_OPTIONS)}
+MODEL_PROVIDER_INDEX = {k: i for i, k in enumerate(MODEL_PROVIDER_OPTIONS)}
+MODEL_INDEX = {k: {m: i for i, m in enumerate(models)} for k, models in MODEL_PROVIDER_MODELS.items()}
+FORM_FIELDS = (
+    'name', 'first_message', 'first_message_mode', 'max_duration',
+    'voice_provider', 'voice_id', 'voice_speed', 'voice_stability',
+    'model_provider', 'model', 'temperature', 'max_tokens', 'system_message',
+    'background_sound', 'end_call_message', 'voicemail_message', 'end_call_phrases'
+)
+
+# Static Settings page copy, kept out of the page branch
+SETUP_GUIDE_MD = """
+**To set up environment variables permanently:**
+
+1. Create a `.env` file in the application directory
+2. Add the following lines:
+```
+VAPI_API_KEY=your_api_key_here
+VAPI_API_BASE=https://api.vapi.ai
+VAPI_ORG_ID=your_org_id_here
+```
+3. Restart the application
+
+**To get your API key:**
+1. Go to [dashboard.vapi.ai](https://dashboard.vapi.ai)
+2. Sign in to your account
+3. Navigate to Settings or API Keys section
+4. Copy your API key
+"""
+FEATURES_MD = """
+**Features Available:**
+- ✅ View all assistants
+- ✅ Create new assistants
+- ✅ Edit existing assistants
+- ✅ Delete assistants
+- ✅ API configuration
+- ✅ Connection testing
+- ✅ Real-time updates
+"""
+# Fixed pieces of the Current Configuration block, joined around the live values
+_CFG_PARTS = (
+    "**Current Configuration:**\n- API Base: `",
+    "`\n- API Key: ",
+    "\n- Total Assistants: ",
+    "\n- Connection Status: "
+)
+ABOUT_MD = """
+**VAPI AI Assistant Manager** is a comprehensive Streamlit application for managing VAPI AI voice assistants.
+
+**Key Features:**
+- 🤖 **Assistant Management**: Create, view, edit, and delete voice AI assistants
+- ⚙️ **Configuration**: Full control over voice, model, and behavior settings
+- 🔧 **API Integration**: Direct integration with VAPI AI platform
+- 📊 **Dashboard**: Overview of all your assistants and their status
+- 🎛️ **Settings**: Easy API configuration and connection testing
+
+**Supported Providers:**
+- **Voice**: ElevenLabs, OpenAI, Azure, PlayHT
+- **Models**: OpenAI GPT-4, Anthropic Claude, Google Gemini, Azure OpenAI
+
+Built with ❤️ using Streamlit and the VAPI AI API.
+"""
+
 # Load environment variables
 load_dotenv()
 
@@ -23,7 +101,10 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+@st.cache_resource
+def _css():
+    """Static stylesheet, built once per server process"""
+    return """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -61,12 +142,6 @@ st.markdown("""
         color: #ffc107;
         font-weight: bold;
     }
-    .metric-card {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #1f77b4;
-    }
     .sidebar-section {
         margin-bottom: 2rem;
         padding: 1rem;
@@ -74,7 +149,9 @@ st.markdown("""
         border-radius: 8px;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.html(_css())
 
 # Initialize session state
 def init_session_state():
@@ -85,39 +162,403 @@ def init_session_state():
         st.session_state.api_base = os.getenv('VAPI_API_BASE', 'https://api.vapi.ai')
     if 'assistants' not in st.session_state:
         st.session_state.assistants = []
-    if 'client' not in st.session_state:
-        st.session_state.client = None
+    if 'assistants_by_id' not in st.session_state:
+        st.session_state.assistants_by_id = {}
+    if 'assistant_options' not in st.session_state:
+        st.session_state.assistant_options = {}
+    if 'assistants_key' not in st.session_state:
+        st.session_state.assistants_key = ()
+    if 'assistants_count' not in st.session_state:
+        st.session_state.assistants_count = 0
+    if 'assistants_loaded' not in st.session_state:
+        st.session_state.assistants_loaded = False
     if 'connection_status' not in st.session_state:
         st.session_state.connection_status = False
+    if 'connection_checked' not in st.session_state:
+        st.session_state.connection_checked = None
+    if 'form_drafts' not in st.session_state:
+        st.session_state.form_drafts = {}
+
+@st.cache_resource(max_entries=8)
+def _build_client(api_key, api_base):
+    """One pooled VAPI client per (api_key, api_base), shared across reruns"""
+    return VAPIClient(api_key=api_key, api_base=api_base)
+
+@st.cache_data(ttl="10s", max_entries=32, show_spinner=False)
+def _probe(api_key_digest, api_base):
+    """Connection test, cached briefly so back-to-back checks share one request"""
+    return get_client().test_connection()
 
 def get_client():
-    """Get or create VAPI client"""
-    if not st.session_state.api_key:
-        return None
-    
-    if (st.session_state.client is None or 
-        st.session_state.client.api_key != st.session_state.api_key or
-        st.session_state.client.api_base != st.session_state.api_base):
-        
-        st.session_state.client = VAPIClient(
-            api_key=st.session_state.api_key,
-            api_base=st.session_state.api_base
-        )
-        # Test connection
-        st.session_state.connection_status = st.session_state.client.test_connection()
+    """Get VAPI client for the current settings"""
+    api_key = st.session_state.api_key
+    return _build_client(api_key, st.session_state.api_base) if api_key else None
+
+def check_connection():
+    """Connection status for the current settings, probed once per client rather than per rerun"""
+    client = get_client()
+    checked = (client.key_digest, client.api_base) if client else None
+    if st.session_state.connection_checked != checked:
+        return test_connection().ok
+    return st.session_state.connection_status
+
+def test_connection():
+    """Probe the API now for the Settings actions; back-to-back calls share one request"""
+    client = get_client()
+    result = _probe(client.key_digest, client.api_base) if client else APIResult(False)
+    st.session_state.connection_status = result.ok
+    st.session_state.connection_checked = (client.key_digest, client.api_base) if client else None
+    return result
+
+def show_api_error(message, result):
+    """Report a failed APIResult; a rejected key also marks the API as disconnected"""
+    if result.status in (401, 403):
+        # Further calls would fail the same way, so stop pages from issuing them
+        st.session_state.connection_status = False
+        _probe.clear()
+        st.error(f"❌ {message} The API key was rejected (HTTP {result.status}). Please check your settings.")
+    elif result.status:
+        st.error(f"❌ {message} (HTTP {result.status})")
+    else:
+        st.error(f"❌ {message} Could not reach the API.")
+
+@st.cache_data(ttl="60s", max_entries=32, show_spinner=False)
+def _fetch_assistants(api_key_digest, api_base, limit=100):
+    """Assistant list for the current client, cached until it expires or a write clears it"""
+    assistants = get_client().iter_assistants(limit)
+    if assistants is None:
+        # Raise rather than return so a failed request is not cached
+        raise ConnectionError("Failed to load assistants")
+    # Materialise the stream once; reruns within the TTL reuse the cached list
+    return list(assistants)
+
+def set_assistants(assistants):
+    """Store the assistant list together with its id lookup and selectbox labels"""
+    st.session_state.assistants = assistants
+    st.session_state.assistants_count = len(assistants)
+    st.session_state.assistants_loaded = True
+    st.session_state.assistants_key = tuple((a['id'], a.get('updatedAt', '')) for a in assistants)
+    st.session_state.assistants_by_id = {a['id']: a for a in assistants}
+    st.session_state.assistant_options = {
+        a['id']: a.get('name') or f"Assistant {a['id'][:8]}..."
+        for a in assistants
+    }
     
-    return st.session_state.client
+    # Edit drafts of assistants that changed or went away would overwrite the server's version
+    current = {edit_form_prefix(a) for a in assistants}
+    for key_prefix in [p for p in st.session_state.form_drafts if p.startswith('edit_') and p not in current]:
+        clear_form_draft(key_prefix)
+
+def edit_form_prefix(assistant):
+    """Edit form key prefix; includes updatedAt so a changed assistant gets a fresh form"""
+    return f"edit_{assistant['id']}_{assistant.get('updatedAt', '')}"
 
 def load_assistants():
     """Load assistants from VAPI AI"""
     client = get_client()
     if client and st.session_state.connection_status:
-        assistants = client.list_assistants()
-        if assistants is not None:
-            st.session_state.assistants = assistants
+        try:
+            set_assistants(_fetch_assistants(client.key_digest, client.api_base))
             return True
+        except ConnectionError:
+            pass
     return False
 
+@st.cache_data(max_entries=1000, show_spinner=False)
+def _summary(assistant_id, updated_at, _assistant):
+    """Cached get_assistant_summary; (id, updatedAt) is the cache key"""
+    return get_assistant_summary(_assistant)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _recent(assistants_key, _assistants, count):
+    """Most recently updated assistants; assistants_key is the (id, updatedAt) cache key"""
+    return heapq.nlargest(count, _assistants, key=lambda x: x.get('updatedAt', ''))
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _assistants_df(assistants_key, _assistants):
+    """Overview table for the View page; assistants_key is the (id, updatedAt) cache key"""
+    # Imported here so pages without the table don't pay for loading pandas
+    import pandas as pd
+    
+    # Create summary columns in a single pass
+    names, ids, voice_providers, model_providers, models, created, updated = [], [], [], [], [], [], []
+    for assistant in _assistants:
+        summary = _summary(assistant['id'], assistant.get('updatedAt', ''), assistant)
+        names.append(summary['name'])
+        ids.append(summary['id'][:12] + '...')
+        voice_providers.append(summary['voice_provider'])
+        model_providers.append(summary['model_provider'])
+        models.append(summary['model_name'])
+        created.append(summary['created'])
+        updated.append(summary['updated'])
+    
+    return pd.DataFrame({
+        'Name': names,
+        'ID': ids,
+        'Voice Provider': voice_providers,
+        'Model Provider': model_providers,
+        'Model': models,
+        'Created': created,
+        'Updated': updated
+    })
+
+def _card_html(summary):
+    """Dashboard card for one assistant summary as a single HTML element"""
+    details = [f"ID: {escape(str(summary['id'])[:20])}..."]
+    if summary['first_message'] != 'N/A':
+        details.append(f"First Message: {escape(str(summary['first_message'])[:50])}...")
+    config = [f"Voice: {escape(str(summary['voice_provider']))}", f"Model: {escape(str(summary['model_provider']))}"]
+    if summary['model_name'] != 'N/A':
+        config.append(f"Model Name: {escape(str(summary['model_name']))}")
+    dates = [f"Created: {escape(str(summary['created']))}", f"Updated: {escape(str(summary['updated']))}"]
+    
+    columns = ''.join(
+        f'<div style="flex: {weight};">{"<br>".join(lines)}</div>'
+        for weight, lines in ((3, [f"<b>{escape(str(summary['name']))}</b>"] + details), (2, config), (2, dates))
+    )
+    return f'<div class="assistant-card" style="display: flex; gap: 1rem;">{columns}</div>'
+
+@lru_cache(maxsize=16)
+def _split_phrases(text):
+    return tuple(phrase for phrase in (line.strip() for line in text.splitlines()) if phrase)
+
+def _parse_phrases(text):
+    """End call phrases from the one-per-line text area, skipping blank lines"""
+    # Fresh list per call so the cached tuple is never mutated
+    return list(_split_phrases(text))
+
+def render_assistant_form(initial, key_prefix, submit_label, allow_delete=False):
+    """
+    Render the assistant form shared by the Create and Edit pages
+    
+    Args:
+        initial: Assistant object the form is seeded from on first render, or a
+            zero-argument function returning one, called only when seeding
+        key_prefix: Prefix for this form's widget keys in session state
+        submit_label: Label for the primary submit button
+        allow_delete: Whether to add a Delete button next to submit
+        
+    Returns:
+        Tuple of (field values, submitted, delete_clicked)
+    """
+    # Seed the keyed widgets when they don't exist yet; after that Streamlit owns their values
+    key = f"{key_prefix}_{{}}".format
+    if key('name') not in st.session_state:
+        # A submitted draft wins over the source data when the widgets are recreated
+        defaults = st.session_state.form_drafts.get(key_prefix)
+        if defaults is None:
+            if callable(initial):
+                initial = initial()
+            voice_config = initial.get('voice') or {}
+            model_config = initial.get('model') or {}
+            defaults = {
+                'name': initial.get('name', ''),
+                'first_message': initial.get('firstMessage', ''),
+                'first_message_mode': initial.get('firstMessageMode') if initial.get('firstMessageMode') in MODE_INDEX else MODE_OPTIONS[0],
+                'max_duration': initial.get('maxDurationSeconds', 600),
+                'voice_provider': voice_config.get('provider') if voice_config.get('provider') in VOICE_PROVIDER_INDEX else VOICE_PROVIDER_OPTIONS[0],
+                'voice_id': voice_config.get('voiceId', ''),
+                'voice_speed': float(voice_config.get('speed', 1.0)),
+                'voice_stability': float(voice_config.get('stability', 0.5)),
+                'model_provider': model_config.get('provider') if model_config.get('provider') in MODEL_PROVIDER_INDEX else MODEL_PROVIDER_OPTIONS[0],
+                'model': model_config.get('model'),
+                'temperature': float(model_config.get('temperature', 0.7)),
+                'max_tokens': model_config.get('maxTokens', 1000),
+                'system_message': next(
+                    (msg.get('content', '') for msg in model_config.get('messages', []) if msg.get('role') == 'system'),
+                    ''
+                ),
+                'background_sound': initial.get('backgroundSound') if initial.get('backgroundSound') in BG_SOUND_INDEX else BG_SOUND_OPTIONS[0],
+                'end_call_message': initial.get('endCallMessage', ''),
+                'voicemail_message': initial.get('voicemailMessage', ''),
+                'end_call_phrases': '\n'.join(initial.get('endCallPhrases', []))
+            }
+        for field, value in defaults.items():
+            st.session_state[key(field)] = value
+    
+    # The model list follows the provider, so drop a model the provider doesn't offer
+    provider_models = MODEL_PROVIDER_MODELS[st.session_state[key('model_provider')]]
+    if st.session_state[key('model')] not in MODEL_INDEX[st.session_state[key('model_provider')]]:
+        st.session_state[key('model')] = provider_models[0]
+    
+    with st.form(key('assistant_form'), clear_on_submit=False):
+        # Basic Information
+        st.markdown('<div class="section-header">Basic Information</div>', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            name = st.text_input(
+                "Assistant Name*",
+                key=key('name'),
+                placeholder="Enter assistant name"
+            )
+            first_message = st.text_area(
+                "First Message", 
+                key=key('first_message'),
+                placeholder="What should the assistant say first?",
+                help="This is the first message the assistant will say when a call starts"
+            )
+        
+        with col2:
+            first_message_mode = st.selectbox(
+                "First Message Mode", 
+                options=MODE_OPTIONS,
+                key=key('first_message_mode'),
+                help="How the assistant should start the conversation"
+            )
+            max_duration = st.number_input(
+                "Max Duration (seconds)", 
+                min_value=10, max_value=43200,
+                key=key('max_duration'),
+                help="Maximum call duration in seconds"
+            )
+        
+        # Voice Configuration
+        st.markdown('<div class="section-header">Voice Configuration</div>', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            voice_provider = st.selectbox(
+                "Voice Provider", 
+                options=VOICE_PROVIDER_OPTIONS,
+                key=key('voice_provider'),
+                format_func=VOICE_PROVIDER_LABELS.get
+            )
+            voice_id = st.text_input(
+                "Voice ID",
+                key=key('voice_id'),
+                placeholder="Enter voice ID (optional)"
+            )
+        
+        with col2:
+            voice_speed = st.slider(
+                "Voice Speed", 
+                min_value=0.5, max_value=2.0, 
+                step=0.1,
+                key=key('voice_speed')
+            )
+            voice_stability = st.slider(
+                "Voice Stability", 
+                min_value=0.0, max_value=1.0, 
+                step=0.1,
+                key=key('voice_stability')
+            )
+        
+        # Model Configuration
+        st.markdown('<div class="section-header">Model Configuration</div>', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            model_provider = st.selectbox(
+                "Model Provider", 
+                options=MODEL_PROVIDER_OPTIONS,
+                key=key('model_provider'),
+                format_func=MODEL_PROVIDER_LABELS.get
+            )
+            
+            # Model selection based on provider
+            model_name = st.selectbox(
+                "Model",
+                options=provider_models,
+                key=key('model')
+            )
+        
+        with col2:
+            temperature = st.slider(
+                "Temperature", 
+                min_value=0.0, max_value=2.0, 
+                step=0.1,
+                key=key('temperature')
+            )
+            max_tokens = st.number_input(
+                "Max Tokens", 
+                min_value=1, max_value=4000, 
+                key=key('max_tokens')
+            )
+        
+        system_message = st.text_area(
+            "System Message", 
+            key=key('system_message'),
+            placeholder="Enter system instructions for the assistant",
+            help="This defines the assistant's behavior and personality"
+        )
+        
+        # Advanced Settings
+        st.markdown('<div class="section-header">Advanced Settings</div>', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            background_sound = st.selectbox(
+                "Background Sound",
+                options=BG_SOUND_OPTIONS,
+                key=key('background_sound')
+            )
+            end_call_message = st.text_input(
+                "End Call Message",
+                key=key('end_call_message'),
+                placeholder="Message when ending call"
+            )
+        
+        with col2:
+            voicemail_message = st.text_input(
+                "Voicemail Message",
+                key=key('voicemail_message'),
+                placeholder="Message for voicemail"
+            )
+            end_call_phrases = st.text_area(
+                "End Call Phrases (one per line)", 
+                key=key('end_call_phrases'),
+                placeholder="goodbye\ntalk to you later\nend call",
+                help="Phrases that will trigger the call to end"
+            )
+        
+        # Action buttons
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            submitted = st.form_submit_button(submit_label, type="primary")
+        with col2:
+            delete_clicked = allow_delete and st.form_submit_button("Delete Assistant", type="secondary")
+    
+    values = {
+        "name": name,
+        "firstMessage": first_message,
+        "firstMessageMode": first_message_mode,
+        "maxDurationSeconds": max_duration,
+        "voice": {
+            "provider": voice_provider,
+            "voiceId": voice_id,
+            "speed": voice_speed,
+            "stability": voice_stability
+        },
+        "model": {
+            "provider": model_provider,
+            "model": model_name,
+            "temperature": temperature,
+            "maxTokens": max_tokens,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": system_message
+                }
+            ] if system_message else []
+        },
+        "backgroundSound": background_sound,
+        "endCallMessage": end_call_message,
+        "voicemailMessage": voicemail_message,
+        "endCallPhrases": _parse_phrases(end_call_phrases)
+    }
+    
+    # Form values only change on submit, so that is when they become a draft worth keeping
+    if submitted:
+        st.session_state.form_drafts[key_prefix] = {field: st.session_state[key(field)] for field in FORM_FIELDS}
+    return values, submitted, delete_clicked
+
+def clear_form_draft(key_prefix):
+    """Drop a form's draft so its next render is seeded afresh"""
+    for field in FORM_FIELDS:
+        st.session_state.pop(f"{key_prefix}_{field}", None)
+    st.session_state.form_drafts.pop(key_prefix, None)
+
 # Initialize session state
 init_session_state()
 
@@ -126,8 +567,7 @@ st.sidebar.markdown('<div class="sidebar-section">', unsafe_allow_html=True)
 st.sidebar.title("🤖 VAPI AI Manager")
 
 # Connection status
-client = get_client()
-if st.session_state.connection_status:
+if check_connection():
     st.sidebar.success("✅ API Connected")
 else:
     st.sidebar.error("❌ API Not Connected")
@@ -145,21 +585,20 @@ page = st.sidebar.selectbox(
 if st.session_state.assistants:
     st.sidebar.markdown('<div class="sidebar-section">', unsafe_allow_html=True)
     st.sidebar.markdown("### Quick Stats")
-    st.sidebar.metric("Total Assistants", len(st.session_state.assistants))
+    st.sidebar.metric("Total Assistants", st.session_state.assistants_count)
     
     # Recent activity
     if st.session_state.assistants:
-        recent = sorted(st.session_state.assistants, 
-                       key=lambda x: x.get('updatedAt', ''), reverse=True)[:3]
+        recent = _recent(st.session_state.assistants_key, st.session_state.assistants, 3)
         st.sidebar.markdown("**Recent:**")
-        for assistant in recent:
-            name = assistant.get('name', 'Unnamed')[:20]
-            st.sidebar.text(f"• {name}")
+        st.sidebar.text('\n'.join(f"• {assistant.get('name', 'Unnamed')[:20]}" for assistant in recent))
     
     st.sidebar.markdown('</div>', unsafe_allow_html=True)
 
 # Refresh button
 if st.sidebar.button("🔄 Refresh Data"):
+    st.session_state.assistants_loaded = False
+    _fetch_assistants.clear()
     load_assistants()
     st.rerun()
 
@@ -172,62 +611,32 @@ if page == "🏠 Dashboard":
     
     with col1:
         status_color = "🟢" if st.session_state.connection_status else "🔴"
-        st.markdown(f'<div class="metric-card">', unsafe_allow_html=True)
         st.metric("API Status", f"{status_color} {'Connected' if st.session_state.connection_status else 'Disconnected'}")
-        st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
-        st.markdown(f'<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("Total Assistants", len(st.session_state.assistants))
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.metric("Total Assistants", st.session_state.assistants_count)
     
     with col3:
-        st.markdown(f'<div class="metric-card">', unsafe_allow_html=True)
         api_display = st.session_state.api_base.replace('https://', '').replace('http://', '')
         st.metric("API Endpoint", api_display)
-        st.markdown('</div>', unsafe_allow_html=True)
     
     with col4:
-        st.markdown(f'<div class="metric-card">', unsafe_allow_html=True)
         key_status = "Set" if st.session_state.api_key else "Not Set"
         st.metric("API Key", key_status)
-        st.markdown('</div>', unsafe_allow_html=True)
     
     # Load assistants if not loaded and connected
-    if st.session_state.connection_status and not st.session_state.assistants:
+    if st.session_state.connection_status and not st.session_state.assistants_loaded:
         load_assistants()
     
     # Recent assistants
     if st.session_state.assistants:
         st.markdown('<div class="section-header">Recent Assistants</div>', unsafe_allow_html=True)
         
-        recent_assistants = sorted(st.session_state.assistants, 
-                                 key=lambda x: x.get('updatedAt', ''), reverse=True)[:5]
+        recent_assistants = _recent(st.session_state.assistants_key, st.session_state.assistants, 5)
         
         for assistant in recent_assistants:
-            summary = get_assistant_summary(assistant)
-            
-            with st.container():
-                st.markdown('<div class="assistant-card">', unsafe_allow_html=True)
-                col1, col2, col3 = st.columns([3, 2, 2])
-                
-                with col1:
-                    st.markdown(f"**{summary['name']}**")
-                    st.text(f"ID: {summary['id'][:20]}...")
-                    if summary['first_message'] != 'N/A':
-                        st.text(f"First Message: {summary['first_message'][:50]}...")
-                
-                with col2:
-                    st.text(f"Voice: {summary['voice_provider']}")
-                    st.text(f"Model: {summary['model_provider']}")
-                    if summary['model_name'] != 'N/A':
-                        st.text(f"Model Name: {summary['model_name']}")
-                
-                with col3:
-                    st.text(f"Created: {summary['created']}")
-                    st.text(f"Updated: {summary['updated']}")
-                
-                st.markdown('</div>', unsafe_allow_html=True)
+            summary = _summary(assistant['id'], assistant.get('updatedAt', ''), assistant)
+            st.html(_card_html(summary))
     else:
         if st.session_state.connection_status:
             st.info("No assistants found. Create your first assistant!")
@@ -242,7 +651,10 @@ elif page == "👁️ View Assistants":
         st.stop()
     
     # Load assistants
-    if st.button("🔄 Refresh Assistants") or not st.session_state.assistants:
+    refresh_clicked = st.button("🔄 Refresh Assistants")
+    if refresh_clicked:
+        _fetch_assistants.clear()
+    if refresh_clicked or not st.session_state.assistants_loaded:
         with st.spinner("Loading assistants..."):
             load_assistants()
     
@@ -250,30 +662,13 @@ elif page == "👁️ View Assistants":
         # Summary table
         st.markdown('<div class="section-header">Assistants Overview</div>', unsafe_allow_html=True)
         
-        # Create summary data
-        summary_data = []
-        for assistant in st.session_state.assistants:
-            summary = get_assistant_summary(assistant)
-            summary_data.append({
-                'Name': summary['name'],
-                'ID': summary['id'][:12] + '...',
-                'Voice Provider': summary['voice_provider'],
-                'Model Provider': summary['model_provider'],
-                'Model': summary['model_name'],
-                'Created': summary['created'],
-                'Updated': summary['updated']
-            })
-        
-        df = pd.DataFrame(summary_data)
+        df = _assistants_df(st.session_state.assistants_key, st.session_state.assistants)
         st.dataframe(df, use_container_width=True, hide_index=True)
         
         # Detailed view
         st.markdown('<div class="section-header">Detailed View</div>', unsafe_allow_html=True)
         
-        assistant_options = {
-            assistant['id']: assistant.get('name', f"Assistant {assistant['id'][:8]}...")
-            for assistant in st.session_state.assistants
-        }
+        assistant_options = st.session_state.assistant_options
         
         selected_id = st.selectbox(
             "Select an assistant to view details:",
@@ -283,40 +678,46 @@ elif page == "👁️ View Assistants":
         )
         
         if selected_id:
-            selected_assistant = next(
-                (a for a in st.session_state.assistants if a['id'] == selected_id), 
-                None
-            )
+            selected_assistant = st.session_state.assistants_by_id.get(selected_id)
             
             if selected_assistant:
+                summary = _summary(selected_id, selected_assistant.get('updatedAt', ''), selected_assistant)
+                first_message = selected_assistant.get('firstMessage')
+                
                 # Display assistant details in organized sections
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     st.subheader("Basic Information")
-                    st.text(f"Name: {selected_assistant.get('name', 'N/A')}")
-                    st.text(f"ID: {selected_assistant.get('id', 'N/A')}")
-                    st.text(f"Created: {get_assistant_summary(selected_assistant)['created']}")
-                    st.text(f"Updated: {get_assistant_summary(selected_assistant)['updated']}")
+                    st.text(
+                        f"Name: {selected_assistant.get('name', 'N/A')}\n"
+                        f"ID: {summary['id']}\n"
+                        f"Created: {summary['created']}\n"
+                        f"Updated: {summary['updated']}"
+                    )
                     
-                    if selected_assistant.get('firstMessage'):
+                    if first_message:
                         st.subheader("First Message")
-                        st.text_area("", value=selected_assistant['firstMessage'], disabled=True, key="first_msg_view")
+                        st.text_area("", value=first_message, disabled=True, key="first_msg_view")
                 
                 with col2:
                     st.subheader("Configuration")
-                    st.text(f"First Message Mode: {selected_assistant.get('firstMessageMode', 'N/A')}")
-                    st.text(f"Max Duration: {selected_assistant.get('maxDurationSeconds', 'N/A')} seconds")
-                    st.text(f"Background Sound: {selected_assistant.get('backgroundSound', 'N/A')}")
+                    st.text(
+                        f"First Message Mode: {selected_assistant.get('firstMessageMode', 'N/A')}\n"
+                        f"Max Duration: {selected_assistant.get('maxDurationSeconds', 'N/A')} seconds\n"
+                        f"Background Sound: {selected_assistant.get('backgroundSound', 'N/A')}"
+                    )
                     
                     # Voice configuration
                     voice_config = selected_assistant.get('voice', {})
                     if voice_config:
                         st.subheader("Voice Settings")
-                        st.text(f"Provider: {voice_config.get('provider', 'N/A')}")
-                        st.text(f"Voice ID: {voice_config.get('voiceId', 'N/A')}")
-                        st.text(f"Speed: {voice_config.get('speed', 'N/A')}")
-                        st.text(f"Stability: {voice_config.get('stability', 'N/A')}")
+                        st.text(
+                            f"Provider: {voice_config.get('provider', 'N/A')}\n"
+                            f"Voice ID: {voice_config.get('voiceId', 'N/A')}\n"
+                            f"Speed: {voice_config.get('speed', 'N/A')}\n"
+                            f"Stability: {voice_config.get('stability', 'N/A')}"
+                        )
                 
                 # Model configuration
                 model_config = selected_assistant.get('model', {})
@@ -325,10 +726,12 @@ elif page == "👁️ View Assistants":
                     col1, col2 = st.columns(2)
                     
                     with col1:
-                        st.text(f"Provider: {model_config.get('provider', 'N/A')}")
-                        st.text(f"Model: {model_config.get('model', 'N/A')}")
-                        st.text(f"Temperature: {model_config.get('temperature', 'N/A')}")
-                        st.text(f"Max Tokens: {model_config.get('maxTokens', 'N/A')}")
+                        st.text(
+                            f"Provider: {model_config.get('provider', 'N/A')}\n"
+                            f"Model: {model_config.get('model', 'N/A')}\n"
+                            f"Temperature: {model_config.get('temperature', 'N/A')}\n"
+                            f"Max Tokens: {model_config.get('maxTokens', 'N/A')}"
+                        )
                     
                     with col2:
                         messages = model_config.get('messages', [])
@@ -350,144 +753,37 @@ elif page == "➕ Create Assistant":
         st.error("❌ API not connected. Please check your settings.")
         st.stop()
     
-    with st.form("create_assistant_form", clear_on_submit=False):
-        # Basic Information
-        st.markdown('<div class="section-header">Basic Information</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            name = st.text_input("Assistant Name*", placeholder="Enter assistant name")
-            first_message = st.text_area(
-                "First Message", 
-                placeholder="What should the assistant say first?",
-                help="This is the first message the assistant will say when a call starts"
-            )
-        
-        with col2:
-            first_message_mode = st.selectbox(
-                "First Message Mode", 
-                options=["assistant-speaks-first", "assistant-waits-for-user", "assistant-speaks-first-with-model-generated-message"],
-                help="How the assistant should start the conversation"
-            )
-            max_duration = st.number_input(
-                "Max Duration (seconds)", 
-                min_value=10, max_value=43200, value=600,
-                help="Maximum call duration in seconds"
-            )
-        
-        # Voice Configuration
-        st.markdown('<div class="section-header">Voice Configuration</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            voice_provider = st.selectbox(
-                "Voice Provider", 
-                options=list(VOICE_PROVIDERS.keys()),
-                format_func=lambda x: f"{VOICE_PROVIDERS[x]['name']} - {VOICE_PROVIDERS[x]['description']}"
-            )
-            voice_id = st.text_input("Voice ID", placeholder="Enter voice ID (optional)")
-        
-        with col2:
-            voice_speed = st.slider("Voice Speed", min_value=0.5, max_value=2.0, value=1.0, step=0.1)
-            voice_stability = st.slider("Voice Stability", min_value=0.0, max_value=1.0, value=0.5, step=0.1)
-        
-        # Model Configuration
-        st.markdown('<div class="section-header">Model Configuration</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            model_provider = st.selectbox(
-                "Model Provider", 
-                options=list(MODEL_PROVIDERS.keys()),
-                format_func=lambda x: f"{MODEL_PROVIDERS[x]['name']} - {MODEL_PROVIDERS[x]['description']}"
-            )
+    # Start from the default template's system prompt; only built when the form is seeded
+    assistant_data, submitted, _ = render_assistant_form(
+        lambda: {'model': {'messages': new_assistant_template()['model']['messages']}},
+        'create',
+        "Create Assistant"
+    )
+    
+    if submitted:
+        if not assistant_data['name']:
+            st.error("❌ Assistant name is required!")
+        else:
+            # Clean the data
+            assistant_data = validate_assistant_data(assistant_data)
             
-            # Model selection based on provider
-            available_models = MODEL_PROVIDERS[model_provider]['models']
-            model_name = st.selectbox("Model", options=available_models)
-        
-        with col2:
-            temperature = st.slider("Temperature", min_value=0.0, max_value=2.0, value=0.7, step=0.1)
-            max_tokens = st.number_input("Max Tokens", min_value=1, max_value=4000, value=1000)
-        
-        system_message = st.text_area(
-            "System Message", 
-            placeholder="Enter system instructions for the assistant",
-            help="This defines the assistant's behavior and personality",
-            value="You are a helpful AI assistant. Be friendly, concise, and helpful in your responses."
-        )
-        
-        # Advanced Settings
-        st.markdown('<div class="section-header">Advanced Settings</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            background_sound = st.selectbox("Background Sound", options=["off", "office", "nature", "cafe"])
-            end_call_message = st.text_input("End Call Message", placeholder="Message when ending call")
-        
-        with col2:
-            voicemail_message = st.text_input("Voicemail Message", placeholder="Message for voicemail")
-            end_call_phrases = st.text_area(
-                "End Call Phrases (one per line)", 
-                placeholder="goodbye\ntalk to you later\nend call",
-                help="Phrases that will trigger the call to end"
-            )
-        
-        # Submit button
-        submitted = st.form_submit_button("Create Assistant", type="primary")
-        
-        if submitted:
-            if not name:
-                st.error("❌ Assistant name is required!")
-            else:
-                # Prepare assistant data
-                assistant_data = {
-                    "name": name,
-                    "firstMessage": first_message,
-                    "firstMessageMode": first_message_mode,
-                    "maxDurationSeconds": max_duration,
-                    "voice": {
-                        "provider": voice_provider,
-                        "voiceId": voice_id,
-                        "speed": voice_speed,
-                        "stability": voice_stability
-                    },
-                    "model": {
-                        "provider": model_provider,
-                        "model": model_name,
-                        "temperature": temperature,
-                        "maxTokens": max_tokens,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": system_message
-                            }
-                        ]
-                    },
-                    "backgroundSound": background_sound,
-                    "endCallMessage": end_call_message,
-                    "voicemailMessage": voicemail_message,
-                    "endCallPhrases": [phrase.strip() for phrase in end_call_phrases.split('\n') if phrase.strip()]
-                }
-                
-                # Clean the data
-                assistant_data = validate_assistant_data(assistant_data)
+            # Create assistant
+            client = get_client()
+            if client:
+                with st.spinner("Creating assistant..."):
+                    result = client.create_assistant(assistant_data)
                 
-                # Create assistant
-                client = get_client()
-                if client:
-                    with st.spinner("Creating assistant..."):
-                        result = client.create_assistant(assistant_data)
-                    
-                    if result:
-                        st.success(f"✅ Assistant '{name}' created successfully!")
-                        st.json(result)
-                        # Refresh assistants list
-                        load_assistants()
-                    else:
-                        st.error("❌ Failed to create assistant. Please check your configuration and try again.")
+                if result.ok:
+                    st.success(f"✅ Assistant '{assistant_data['name']}' created successfully!")
+                    st.json(result.data)
+                    clear_form_draft('create')
+                    # Refresh assistants list
+                    _fetch_assistants.clear()
+                    load_assistants()
                 else:
-                    st.error("❌ API client not available. Please check your settings.")
+                    show_api_error("Failed to create assistant.", result)
+            else:
+                st.error("❌ API client not available. Please check your settings.")
 
 elif page == "✏️ Edit Assistant":
     st.markdown('<h1 class="main-header">Edit Assistant</h1>', unsafe_allow_html=True)
@@ -497,16 +793,13 @@ elif page == "✏️ Edit Assistant":
         st.stop()
     
     # Load assistants if not loaded
-    if not st.session_state.assistants:
+    if not st.session_state.assistants_loaded:
         with st.spinner("Loading assistants..."):
             load_assistants()
     
     if st.session_state.assistants:
         # Select assistant to edit
-        assistant_options = {
-            assistant['id']: assistant.get('name', f"Assistant {assistant['id'][:8]}...")
-            for assistant in st.session_state.assistants
-        }
+        assistant_options = st.session_state.assistant_options
         
         selected_id = st.selectbox(
             "Select Assistant to Edit:",
@@ -516,226 +809,62 @@ elif page == "✏️ Edit Assistant":
         )
         
         if selected_id:
-            selected_assistant = next(
-                (a for a in st.session_state.assistants if a['id'] == selected_id), 
-                None
-            )
+            selected_assistant = st.session_state.assistants_by_id.get(selected_id)
             
             if selected_assistant:
-                with st.form("edit_assistant_form"):
-                    # Basic Information
-                    st.markdown('<div class="section-header">Basic Information</div>', unsafe_allow_html=True)
-                    
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        name = st.text_input("Assistant Name*", value=selected_assistant.get('name', ''))
-                        first_message = st.text_area(
-                            "First Message", 
-                            value=selected_assistant.get('firstMessage', '')
-                        )
-                    
-                    with col2:
-                        current_mode = selected_assistant.get('firstMessageMode', 'assistant-speaks-first')
-                        mode_options = ["assistant-speaks-first", "assistant-waits-for-user", "assistant-speaks-first-with-model-generated-message"]
-                        mode_index = mode_options.index(current_mode) if current_mode in mode_options else 0
-                        
-                        first_message_mode = st.selectbox(
-                            "First Message Mode", 
-                            options=mode_options,
-                            index=mode_index
-                        )
-                        max_duration = st.number_input(
-                            "Max Duration (seconds)", 
-                            min_value=10, max_value=43200, 
-                            value=selected_assistant.get('maxDurationSeconds', 600)
-                        )
-                    
-                    # Voice Configuration
-                    st.markdown('<div class="section-header">Voice Configuration</div>', unsafe_allow_html=True)
-                    voice_config = selected_assistant.get('voice', {})
-                    
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        current_voice_provider = voice_config.get('provider', 'elevenlabs')
-                        voice_provider_options = list(VOICE_PROVIDERS.keys())
-                        voice_provider_index = voice_provider_options.index(current_voice_provider) if current_voice_provider in voice_provider_options else 0
-                        
-                        voice_provider = st.selectbox(
-                            "Voice Provider", 
-                            options=voice_provider_options,
-                            index=voice_provider_index,
-                            format_func=lambda x: f"{VOICE_PROVIDERS[x]['name']} - {VOICE_PROVIDERS[x]['description']}"
-                        )
-                        voice_id = st.text_input("Voice ID", value=voice_config.get('voiceId', ''))
-                    
-                    with col2:
-                        voice_speed = st.slider(
-                            "Voice Speed", 
-                            min_value=0.5, max_value=2.0, 
-                            value=voice_config.get('speed', 1.0), 
-                            step=0.1
-                        )
-                        voice_stability = st.slider(
-                            "Voice Stability", 
-                            min_value=0.0, max_value=1.0, 
-                            value=voice_config.get('stability', 0.5), 
-                            step=0.1
-                        )
-                    
-                    # Model Configuration
-                    st.markdown('<div class="section-header">Model Configuration</div>', unsafe_allow_html=True)
-                    model_config = selected_assistant.get('model', {})
-                    
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        current_model_provider = model_config.get('provider', 'openai')
-                        model_provider_options = list(MODEL_PROVIDERS.keys())
-                        model_provider_index = model_provider_options.index(current_model_provider) if current_model_provider in model_provider_options else 0
-                        
-                        model_provider = st.selectbox(
-                            "Model Provider", 
-                            options=model_provider_options,
-                            index=model_provider_index,
-                            format_func=lambda x: f"{MODEL_PROVIDERS[x]['name']} - {MODEL_PROVIDERS[x]['description']}"
-                        )
-                        
-                        # Model selection based on provider
-                        available_models = MODEL_PROVIDERS[model_provider]['models']
-                        current_model = model_config.get('model', available_models[0])
-                        model_index = available_models.index(current_model) if current_model in available_models else 0
-                        
-                        model_name = st.selectbox("Model", options=available_models, index=model_index)
-                    
-                    with col2:
-                        temperature = st.slider(
-                            "Temperature", 
-                            min_value=0.0, max_value=2.0, 
-                            value=model_config.get('temperature', 0.7), 
-                            step=0.1
-                        )
-                        max_tokens = st.number_input(
-                            "Max Tokens", 
-                            min_value=1, max_value=4000, 
-                            value=model_config.get('maxTokens', 1000)
-                        )
-                    
-                    # Get system message
-                    system_message = ""
-                    messages = model_config.get('messages', [])
-                    for msg in messages:
-                        if msg.get('role') == 'system':
-                            system_message = msg.get('content', '')
-                            break
-                    
-                    system_message = st.text_area(
-                        "System Message", 
-                        value=system_message,
-                        help="This defines the assistant's behavior and personality"
-                    )
-                    
-                    # Advanced Settings
-                    st.markdown('<div class="section-header">Advanced Settings</div>', unsafe_allow_html=True)
-                    
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        current_bg_sound = selected_assistant.get('backgroundSound', 'off')
-                        bg_sound_options = ["off", "office", "nature", "cafe"]
-                        bg_sound_index = bg_sound_options.index(current_bg_sound) if current_bg_sound in bg_sound_options else 0
+                update_data, submitted, delete_clicked = render_assistant_form(
+                    selected_assistant, edit_form_prefix(selected_assistant), "Update Assistant", allow_delete=True
+                )
+                
+                if submitted:
+                    if not update_data['name']:
+                        st.error("❌ Assistant name is required!")
+                    else:
+                        # Clean the data
+                        update_data = validate_assistant_data(update_data)
                         
-                        background_sound = st.selectbox("Background Sound", options=bg_sound_options, index=bg_sound_index)
-                        end_call_message = st.text_input(
-                            "End Call Message", 
-                            value=selected_assistant.get('endCallMessage', '')
-                        )
-                    
-                    with col2:
-                        voicemail_message = st.text_input(
-                            "Voicemail Message", 
-                            value=selected_assistant.get('voicemailMessage', '')
-                        )
-                        end_call_phrases_text = '\n'.join(selected_assistant.get('endCallPhrases', []))
-                        end_call_phrases = st.text_area(
-                            "End Call Phrases (one per line)", 
-                            value=end_call_phrases_text
-                        )
-                    
-                    # Action buttons
-                    col1, col2, col3 = st.columns([2, 1, 1])
-                    with col1:
-                        submitted = st.form_submit_button("Update Assistant", type="primary")
-                    with col2:
-                        delete_clicked = st.form_submit_button("Delete Assistant", type="secondary")
-                    
-                    if submitted:
-                        if not name:
-                            st.error("❌ Assistant name is required!")
-                        else:
-                            # Prepare update data
-                            update_data = {
-                                "name": name,
-                                "firstMessage": first_message,
-                                "firstMessageMode": first_message_mode,
-                                "maxDurationSeconds": max_duration,
-                                "voice": {
-                                    "provider": voice_provider,
-                                    "voiceId": voice_id,
-                                    "speed": voice_speed,
-                                    "stability": voice_stability
-                                },
-                                "model": {
-                                    "provider": model_provider,
-                                    "model": model_name,
-                                    "temperature": temperature,
-                                    "maxTokens": max_tokens,
-                                    "messages": [
-                                        {
-                                            "role": "system",
-                                            "content": system_message
-                                        }
-                                    ] if system_message else []
-                                },
-                                "backgroundSound": background_sound,
-                                "endCallMessage": end_call_message,
-                                "voicemailMessage": voicemail_message,
-                                "endCallPhrases": [phrase.strip() for phrase in end_call_phrases.split('\n') if phrase.strip()]
-                            }
-                            
-                            # Clean the data
-                            update_data = validate_assistant_data(update_data)
+                        # Update assistant
+                        client = get_client()
+                        if client:
+                            with st.spinner("Updating assistant..."):
+                                result = client.update_assistant(selected_id, update_data)
                             
-                            # Update assistant
-                            client = get_client()
-                            if client:
-                                with st.spinner("Updating assistant..."):
-                                    result = client.update_assistant(selected_id, update_data)
-                                
-                                if result:
-                                    st.success(f"✅ Assistant '{name}' updated successfully!")
-                                    st.json(result)
-                                    # Refresh assistants list
-                                    load_assistants()
-                                else:
-                                    st.error("❌ Failed to update assistant. Please check your configuration and try again.")
+                            if result.ok:
+                                st.success(f"✅ Assistant '{update_data['name']}' updated successfully!")
+                                st.json(result.data)
+                                clear_form_draft(edit_form_prefix(selected_assistant))
+                                # Refresh assistants list
+                                _fetch_assistants.clear()
+                                load_assistants()
                             else:
-                                st.error("❌ API client not available. Please check your settings.")
-                    
-                    if delete_clicked:
-                        st.warning("⚠️ This action cannot be undone!")
-                        if st.button("Confirm Delete", type="secondary", key="confirm_delete"):
-                            client = get_client()
-                            if client:
-                                with st.spinner("Deleting assistant..."):
-                                    success = client.delete_assistant(selected_id)
-                                
-                                if success:
-                                    st.success("✅ Assistant deleted successfully!")
-                                    # Refresh assistants list
-                                    load_assistants()
-                                    st.rerun()
-                                else:
-                                    st.error("❌ Failed to delete assistant.")
+                                show_api_error("Failed to update assistant.", result)
+                        else:
+                            st.error("❌ API client not available. Please check your settings.")
+                
+                # The confirm button lives outside the form, so remember which assistant it is for
+                if delete_clicked:
+                    st.session_state.confirm_delete_id = selected_id
+                
+                if st.session_state.get('confirm_delete_id') == selected_id:
+                    st.warning("⚠️ This action cannot be undone!")
+                    if st.button("Confirm Delete", type="secondary", key="confirm_delete"):
+                        st.session_state.confirm_delete_id = None
+                        client = get_client()
+                        if client:
+                            with st.spinner("Deleting assistant..."):
+                                result = client.delete_assistant(selected_id)
+                            
+                            if result.ok:
+                                st.success("✅ Assistant deleted successfully!")
+                                clear_form_draft(edit_form_prefix(selected_assistant))
+                                # Refresh assistants list
+                                _fetch_assistants.clear()
+                                load_assistants()
+                                st.rerun()
                             else:
-                                st.error("❌ API client not available. Please check your settings.")
+                                show_api_error("Failed to delete assistant.", result)
+                        else:
+                            st.error("❌ API client not available. Please check your settings.")
     else:
         st.info("No assistants found. Create your first assistant!")
 
@@ -771,21 +900,23 @@ elif page == "⚙️ Settings":
             # Update session state
             st.session_state.api_key = api_key
             st.session_state.api_base = api_base
-            st.session_state.client = None  # Reset client to force recreation
             
             # Test connection
             if api_key:
                 with st.spinner("Testing API connection..."):
-                    client = get_client()
-                    if st.session_state.connection_status:
+                    result = test_connection()
+                    if result.ok:
                         st.success("✅ API connection successful!")
                         # Load assistants with new settings
                         load_assistants()
                     else:
-                        st.error("❌ API connection failed. Please check your API key and try again.")
+                        show_api_error("API connection failed.", result)
             else:
                 st.warning("⚠️ API key is required for the application to work.")
     
+    # Read after the form so a save that reloads assistants is reflected below
+    assistants_count = st.session_state.assistants_count
+    
     # Connection Status
     st.markdown('<div class="section-header">Connection Status</div>', unsafe_allow_html=True)
     
@@ -794,7 +925,7 @@ elif page == "⚙️ Settings":
         if st.session_state.connection_status:
             st.success("✅ API Connected")
             st.info(f"**Endpoint:** {st.session_state.api_base}")
-            st.info(f"**Assistants Loaded:** {len(st.session_state.assistants)}")
+            st.info(f"**Assistants Loaded:** {assistants_count}")
         else:
             st.error("❌ API Not Connected")
             st.warning("Please configure your API key above.")
@@ -803,87 +934,37 @@ elif page == "⚙️ Settings":
         if st.button("🔍 Test Connection"):
             if st.session_state.api_key:
                 with st.spinner("Testing connection..."):
-                    client = get_client()
-                    if st.session_state.connection_status:
+                    result = test_connection()
+                    if result.ok:
                         st.success("✅ Connection successful!")
                     else:
-                        st.error("❌ Connection failed!")
+                        show_api_error("Connection failed!", result)
             else:
                 st.error("❌ API key required!")
     
     # Environment Setup Guide
     st.markdown('<div class="section-header">Environment Setup</div>', unsafe_allow_html=True)
     
-    st.info("""
-    **To set up environment variables permanently:**
-    
-    1. Create a `.env` file in the application directory
-    2. Add the following lines:
-    ```
-    VAPI_API_KEY=your_api_key_here
-    VAPI_API_BASE=https://api.vapi.ai
-    VAPI_ORG_ID=your_org_id_here
-    ```
-    3. Restart the application
-    
-    **To get your API key:**
-    1. Go to [dashboard.vapi.ai](https://dashboard.vapi.ai)
-    2. Sign in to your account
-    3. Navigate to Settings or API Keys section
-    4. Copy your API key
-    """)
+    st.info(SETUP_GUIDE_MD)
     
     # Application Information
     st.markdown('<div class="section-header">Application Information</div>', unsafe_allow_html=True)
     
     col1, col2 = st.columns(2)
     with col1:
-        st.markdown("""
-        **Current Configuration:**
-        - API Base: `{}`
-        - API Key: {}
-        - Total Assistants: {}
-        - Connection Status: {}
-        """.format(
-            st.session_state.api_base,
-            '✅ Set' if st.session_state.api_key else '❌ Not set',
-            len(st.session_state.assistants),
-            '✅ Connected' if st.session_state.connection_status else '❌ Disconnected'
-        ))
+        st.markdown("".join([
+            _CFG_PARTS[0], st.session_state.api_base,
+            _CFG_PARTS[1], '✅ Set' if st.session_state.api_key else '❌ Not set',
+            _CFG_PARTS[2], str(assistants_count),
+            _CFG_PARTS[3], '✅ Connected' if st.session_state.connection_status else '❌ Disconnected'
+        ]))
     
     with col2:
-        st.markdown("""
-        **Features Available:**
-        - ✅ View all assistants
-        - ✅ Create new assistants
-        - ✅ Edit existing assistants
-        - ✅ Delete assistants
-        - ✅ API configuration
-        - ✅ Connection testing
-        - ✅ Real-time updates
-        """)
+        st.markdown(FEATURES_MD)
     
     # About Section
     st.markdown('<div class="section-header">About</div>', unsafe_allow_html=True)
-    st.markdown("""
-    **VAPI AI Assistant Manager** is a comprehensive Streamlit application for managing VAPI AI voice assistants.
-    
-    **Key Features:**
-    - 🤖 **Assistant Management**: Create, view, edit, and delete voice AI assistants
-    - ⚙️ **Configuration**: Full control over voice, model, and behavior settings
-    - 🔧 **API Integration**: Direct integration with VAPI AI platform
-    - 📊 **Dashboard**: Overview of all your assistants and their status
-    - 🎛️ **Settings**: Easy API configuration and connection testing
-    
-    **Supported Providers:**
-    - **Voice**: ElevenLabs, OpenAI, Azure, PlayHT
-    - **Models**: OpenAI GP
-
-
-T-4, Anthropic Claude, Google Gemini, Azure OpenAI
-    
-    Built with ❤️ using Streamlit and the VAPI AI API.
-    """)
+    st.markdown(ABOUT_MD)
 
 # Footer
 st.markdown("---")
@@ -3,10 +3,52 @@ VAPI AI Client Module
 Handles all API interactions with VAPI AI platform
 """
 
+import hashlib
+import logging
+import pickle
+import threading
 import requests
 import json
-from typing import Dict, List, Optional, Any
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # orjson wheel unavailable, fall back to the stdlib
+    from json import dumps as json_dumps, loads as json_loads
+try:
+    import httpx
+    import h2  # noqa: F401  (required by httpx for http2=True)
+except ImportError:  # HTTP/2 bulk fetches are optional, fall back to the pooled session
+    httpx = None
+try:
+    import ijson
+except ImportError:  # streaming list parse is optional, fall back to a full decode
+    ijson = None
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as TransportError
+from urllib3.util.retry import Retry
+from typing import Dict, Iterator, List, Optional, Any
+from dataclasses import dataclass
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# (connect, read) timeouts in seconds
+REQUEST_TIMEOUT = (3.05, 15)
+PROBE_TIMEOUT = (3.05, 5)
+
+
+@dataclass(frozen=True, slots=True)
+class APIResult:
+    """Outcome of an API call; truthy when the call succeeded"""
+    ok: bool
+    data: Any = None
+    status: int = 0  # HTTP status, 0 when no response was received
+    
+    def __bool__(self) -> bool:
+        return self.ok
 
 
 class VAPIClient:
@@ -22,12 +64,55 @@ class VAPIClient:
         """
         self.api_key = api_key
         self.api_base = api_base.rstrip('/')
+        # Short stand-in for the key wherever a cache key is needed, so the secret isn't hashed or stored
+        self.key_digest = hashlib.blake2b(api_key.encode(), digest_size=8).hexdigest()
         self.headers = {
             'Authorization': f'Bearer {api_key}',
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
         }
+        
+        # One pooled session per client so calls reuse keep-alive connections;
+        # headers set here are sent on every request without a per-call merge
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.headers['Accept-Encoding'] = 'gzip'
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # PATCH bodies set absolute values, so a replay is harmless; POST
+                # could create duplicates and is never retried
+                allowed_methods=frozenset(['GET', 'HEAD', 'OPTIONS', 'PATCH', 'DELETE']),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # HTTP/2 client for concurrent fetches, created on first bulk call
+        self._http2 = None
+        self._http2_lock = threading.Lock()
+    
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections"""
+        self.session.close()
+        if self._http2 is not None:
+            self._http2.close()
+    
+    def __enter__(self):
+        return self
     
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Optional[Any]:
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> APIResult:
         """
         Make HTTP request to VAPI AI API
         
@@ -37,47 +122,54 @@ class VAPIClient:
             data: Request data for POST/PATCH requests
             
         Returns:
-            Response data or None if error
+            APIResult with the response data, or ok=False and the HTTP status if error
         """
         url = f"{self.api_base}{endpoint}"
         
+        if method not in ('GET', 'POST', 'PATCH', 'DELETE'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=self.headers)
-            elif method == 'POST':
-                response = requests.post(url, headers=self.headers, json=data)
-            elif method == 'PATCH':
-                response = requests.patch(url, headers=self.headers, json=data)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=self.headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            body = json_dumps(data) if data is not None else None
+            response = self.session.request(method, url, data=body, timeout=REQUEST_TIMEOUT)
             
             # Handle successful responses
             if response.status_code in [200, 201]:
-                return response.json() if response.content else {}
+                return APIResult(True, json_loads(response.content) if response.content else {}, response.status_code)
             elif response.status_code == 204:  # No content (successful DELETE)
-                return {}
+                return APIResult(True, {}, 204)
             else:
-                print(f"API Error: {response.status_code} - {response.text}")
-                return None
+                logger.warning("API Error: %s - %s", response.status_code, response.text)
+                return APIResult(False, status=response.status_code)
                 
         except requests.exceptions.RequestException as e:
-            print(f"Connection Error: {str(e)}")
-            return None
-        except json.JSONDecodeError as e:
-            print(f"JSON Decode Error: {str(e)}")
-            return None
+            logger.warning("Connection Error: %s", e)
+            return APIResult(False)
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
+            logger.warning("JSON Decode Error: %s", e)
+            return APIResult(False, status=response.status_code)
     
-    def test_connection(self) -> bool:
+    def test_connection(self) -> APIResult:
         """
         Test API connection
         
         Returns:
-            True if connection successful, False otherwise
+            APIResult that is truthy if connection successful
         """
-        result = self._make_request('GET', '/assistant?limit=1')
-        return result is not None
+        # HEAD skips downloading and parsing a response body
+        try:
+            response = self.session.head(
+                f"{self.api_base}/assistant", params={'limit': 1}, timeout=PROBE_TIMEOUT
+            )
+        except requests.exceptions.RequestException as e:
+            logger.warning("Connection Error: %s", e)
+            return APIResult(False)
+        
+        if response.status_code == 405:  # HEAD not allowed, probe with GET instead
+            return self._make_request('GET', '/assistant?limit=1')
+        if response.status_code >= 400:
+            logger.warning("API Error: %s", response.status_code)
+        return APIResult(response.status_code < 400, status=response.status_code)
     
     def list_assistants(self, limit: int = 100) -> Optional[List[Dict]]:
         """
@@ -89,7 +181,47 @@ class VAPIClient:
         Returns:
             List of assistant objects or None if error
         """
-        return self._make_request('GET', f'/assistant?limit={limit}')
+        return self._make_request('GET', f'/assistant?limit={limit}').data
+    
+    def iter_assistants(self, limit: int = 100) -> Optional[Iterator[Dict]]:
+        """
+        List assistants, parsing the response incrementally as it streams in
+        
+        Args:
+            limit: Maximum number of assistants to return
+            
+        Returns:
+            Iterator over assistant objects or None if error
+        """
+        if ijson is None:
+            assistants = self.list_assistants(limit)
+            return None if assistants is None else iter(assistants)
+        
+        try:
+            response = self.session.get(
+                f"{self.api_base}/assistant?limit={limit}", stream=True, timeout=REQUEST_TIMEOUT
+            )
+        except requests.exceptions.RequestException as e:
+            logger.warning("Connection Error: %s", e)
+            return None
+        
+        if response.status_code != 200:
+            logger.warning("API Error: %s - %s", response.status_code, response.text)
+            response.close()
+            return None
+        return self._stream_items(response)
+    
+    @staticmethod
+    def _stream_items(response: requests.Response) -> Iterator[Dict]:
+        """Yield the items of a streamed JSON array response, closing it when done"""
+        response.raw.decode_content = True
+        try:
+            yield from ijson.items(response.raw, 'item', use_float=True)
+        except (requests.exceptions.RequestException, TransportError, ijson.JSONError) as e:
+            logger.warning("Stream Error: %s", e)
+            raise ConnectionError("Assistant list stream was interrupted") from e
+        finally:
+            response.close()
     
     def get_assistant(self, assistant_id: str) -> Optional[Dict]:
         """
@@ -101,9 +233,51 @@ class VAPIClient:
         Returns:
             Assistant object or None if error
         """
-        return self._make_request('GET', f'/assistant/{assistant_id}')
+        return self._make_request('GET', f'/assistant/{assistant_id}').data
+    
+    def get_assistants_bulk(self, assistant_ids: List[str]) -> List[Optional[Dict]]:
+        """
+        Get several assistants concurrently, multiplexed over HTTP/2 when httpx is installed
+        
+        Args:
+            assistant_ids: Assistant IDs
+            
+        Returns:
+            Assistant objects in the order of assistant_ids, None for any that failed
+        """
+        if not assistant_ids:
+            return []
+        get = self.get_assistant if httpx is None else self._get_assistant_http2
+        with ThreadPoolExecutor(max_workers=min(8, len(assistant_ids))) as executor:
+            return list(executor.map(get, assistant_ids))
+    
+    def _http2_client(self) -> "httpx.Client":
+        """HTTP/2 client sharing this client's headers; one multiplexed connection serves all threads"""
+        with self._http2_lock:
+            if self._http2 is None:
+                self._http2 = httpx.Client(
+                    base_url=self.api_base,
+                    headers=self.headers,
+                    http2=True,
+                    timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+                    limits=httpx.Limits(max_keepalive_connections=8, max_connections=16)
+                )
+            return self._http2
+    
+    def _get_assistant_http2(self, assistant_id: str) -> Optional[Dict]:
+        """get_assistant over the HTTP/2 client"""
+        try:
+            response = self._http2_client().get(f'/assistant/{assistant_id}')
+            if response.status_code == 200:
+                return json_loads(response.content)
+            logger.warning("API Error: %s - %s", response.status_code, response.text)
+        except httpx.HTTPError as e:
+            logger.warning("Connection Error: %s", e)
+        except json.JSONDecodeError as e:
+            logger.warning("JSON Decode Error: %s", e)
+        return None
     
-    def create_assistant(self, assistant_data: Dict) -> Optional[Dict]:
+    def create_assistant(self, assistant_data: Dict) -> APIResult:
         """
         Create new assistant
         
@@ -111,11 +285,11 @@ class VAPIClient:
             assistant_data: Assistant configuration data
             
         Returns:
-            Created assistant object or None if error
+            APIResult carrying the created assistant object
         """
         return self._make_request('POST', '/assistant', assistant_data)
     
-    def update_assistant(self, assistant_id: str, assistant_data: Dict) -> Optional[Dict]:
+    def update_assistant(self, assistant_id: str, assistant_data: Dict) -> APIResult:
         """
         Update existing assistant
         
@@ -124,11 +298,11 @@ class VAPIClient:
             assistant_data: Updated assistant configuration data
             
         Returns:
-            Updated assistant object or None if error
+            APIResult carrying the updated assistant object
         """
         return self._make_request('PATCH', f'/assistant/{assistant_id}', assistant_data)
     
-    def delete_assistant(self, assistant_id: str) -> bool:
+    def delete_assistant(self, assistant_id: str) -> APIResult:
         """
         Delete assistant
         
@@ -136,10 +310,9 @@ class VAPIClient:
             assistant_id: Assistant ID
             
         Returns:
-            True if successful, False otherwise
+            APIResult that is truthy if successful
         """
-        result = self._make_request('DELETE', f'/assistant/{assistant_id}')
-        return result is not None
+        return self._make_request('DELETE', f'/assistant/{assistant_id}')
     
     def list_calls(self, assistant_id: Optional[str] = None, limit: int = 100) -> Optional[List[Dict]]:
         """
@@ -155,9 +328,9 @@ class VAPIClient:
         endpoint = f'/call?limit={limit}'
         if assistant_id:
             endpoint += f'&assistantId={assistant_id}'
-        return self._make_request('GET', endpoint)
+        return self._make_request('GET', endpoint).data
     
-    def create_call(self, call_data: Dict) -> Optional[Dict]:
+    def create_call(self, call_data: Dict) -> APIResult:
         """
         Create a new call
         
@@ -165,11 +338,113 @@ class VAPIClient:
             call_data: Call configuration data
             
         Returns:
-            Created call object or None if error
+            APIResult carrying the created call object
         """
         return self._make_request('POST', '/call', call_data)
 
 
+# Shape of the payloads the app builds: None marks a scalar field, a dict a
+# nested object and a one-item list a list of that item's shape
+ASSISTANT_SCHEMA = {
+    "name": None,
+    "firstMessage": None,
+    "firstMessageMode": None,
+    "maxDurationSeconds": None,
+    "voice": {"provider": None, "voiceId": None, "speed": None, "stability": None},
+    "model": {
+        "provider": None,
+        "model": None,
+        "temperature": None,
+        "maxTokens": None,
+        "messages": [{"role": None, "content": None}]
+    },
+    "backgroundSound": None,
+    "endCallMessage": None,
+    "voicemailMessage": None,
+    "endCallPhrases": [None]
+}
+
+
+def _compile_cleaner(schema: Dict):
+    """
+    Generate a straight-line cleaner specialised to a schema
+    
+    The generated function drops None and "" values like _clean_generic, but
+    returns None as soon as the data strays from the schema so the caller can
+    fall back to the generic walk.
+    
+    Args:
+        schema: Nested schema in the ASSISTANT_SCHEMA format
+        
+    Returns:
+        Compiled cleaner function
+    """
+    namespace = {'_SCALARS': (str, int, float, bool)}
+    lines = ['def _clean_known(d0):']
+    counter = iter(range(1, 1000))
+    
+    def emit_value(shape, src, indent):
+        """Emit code binding a cleaned copy of src; returns the copy's variable name"""
+        pad = '    ' * indent
+        if shape is None:
+            lines.append(f'{pad}if type({src}) not in _SCALARS: return None')
+            return src
+        n = next(counter)
+        if isinstance(shape, dict):
+            keys = f'_KEYS{n}'
+            namespace[keys] = frozenset(shape)
+            lines.append(f'{pad}if type({src}) is not dict or not {src}.keys() <= {keys}: return None')
+            lines.append(f'{pad}c{n} = {{}}')
+            for key, sub_shape in shape.items():
+                value = f'v{next(counter)}'
+                lines.append(f'{pad}{value} = {src}.get({key!r})')
+                lines.append(f'{pad}if {value} is not None and {value} != "":')
+                child = emit_value(sub_shape, value, indent + 1)
+                lines.append(f'{pad}    c{n}[{key!r}] = {child}')
+            return f'c{n}'
+        item = f'i{n}'
+        lines.append(f'{pad}if type({src}) is not list: return None')
+        lines.append(f'{pad}c{n} = []')
+        lines.append(f'{pad}for {item} in {src}:')
+        lines.append(f'{pad}    if {item} is None or {item} == "": continue')
+        child = emit_value(shape[0], item, indent + 1)
+        lines.append(f'{pad}    c{n}.append({child})')
+        return f'c{n}'
+    
+    lines.append(f'    return {emit_value(schema, "d0", 1)}')
+    exec('\n'.join(lines), namespace)
+    return namespace['_clean_known']
+
+
+_clean_known = _compile_cleaner(ASSISTANT_SCHEMA)
+
+
+def _clean_generic(data: Dict) -> Dict:
+    """Copy of arbitrary nested data without None and "" values"""
+    # Copy containers with an explicit stack rather than recursing
+    cleaned_data = {}
+    stack = [(data, cleaned_data)]
+    while stack:
+        source, target = stack.pop()
+        is_list = isinstance(target, list)
+        for key, value in (enumerate(source) if is_list else source.items()):
+            if value is None or value == "":
+                continue
+            if isinstance(value, dict):
+                child = {}
+                stack.append((value, child))
+            elif isinstance(value, list):
+                child = []
+                stack.append((value, child))
+            else:
+                child = value
+            if is_list:
+                target.append(child)
+            else:
+                target[key] = child
+    return cleaned_data
+
+
 def validate_assistant_data(data: Dict) -> Dict:
     """
     Validate and clean assistant data before sending to API
@@ -180,33 +455,21 @@ def validate_assistant_data(data: Dict) -> Dict:
     Returns:
         Cleaned assistant data
     """
-    # Remove empty strings and None values
-    def clean_dict(d):
-        if isinstance(d, dict):
-            return {k: clean_dict(v) for k, v in d.items() if v is not None and v != ""}
-        elif isinstance(d, list):
-            return [clean_dict(item) for item in d if item is not None and item != ""]
-        else:
-            return d
-    
-    cleaned_data = clean_dict(data)
+    # Remove empty strings and None values, specialised path for the app's own payloads
+    cleaned_data = _clean_known(data)
+    if cleaned_data is None:
+        cleaned_data = _clean_generic(data)
     
-    # Ensure required nested structures exist
-    if 'voice' in cleaned_data and cleaned_data['voice']:
-        voice_data = cleaned_data['voice']
-        # Remove empty voice configuration
-        if not any(voice_data.values()):
-            del cleaned_data['voice']
-    
-    if 'model' in cleaned_data and cleaned_data['model']:
-        model_data = cleaned_data['model']
-        # Remove empty model configuration
-        if not any(model_data.values()):
-            del cleaned_data['model']
+    # Remove empty voice/model configuration
+    for section in ('voice', 'model'):
+        section_data = cleaned_data.get(section)
+        if section_data and not any(section_data.values()):
+            del cleaned_data[section]
     
     return cleaned_data
 
 
+@lru_cache(maxsize=2048)
 def format_datetime(dt_string: str) -> str:
     """
     Format datetime string for display
@@ -224,6 +487,11 @@ def format_datetime(dt_string: str) -> str:
         return dt_string
 
 
+# Shared defaults for get_assistant_summary; _EMPTY must never be mutated
+_NA = 'N/A'
+_EMPTY: Dict = {}
+
+
 def get_assistant_summary(assistant: Dict) -> Dict:
     """
     Get summary information for an assistant
@@ -234,15 +502,17 @@ def get_assistant_summary(assistant: Dict) -> Dict:
     Returns:
         Summary dictionary
     """
+    voice = assistant.get('voice') or _EMPTY
+    model = assistant.get('model') or _EMPTY
     return {
-        'id': assistant.get('id', 'N/A'),
+        'id': assistant.get('id', _NA),
         'name': assistant.get('name', 'Unnamed Assistant'),
         'created': format_datetime(assistant.get('createdAt', '')),
         'updated': format_datetime(assistant.get('updatedAt', '')),
-        'first_message': assistant.get('firstMessage', 'N/A'),
-        'voice_provider': assistant.get('voice', {}).get('provider', 'N/A'),
-        'model_provider': assistant.get('model', {}).get('provider', 'N/A'),
-        'model_name': assistant.get('model', {}).get('model', 'N/A')
+        'first_message': assistant.get('firstMessage', _NA),
+        'voice_provider': voice.get('provider', _NA),
+        'model_provider': model.get('provider', _NA),
+        'model_name': model.get('model', _NA)
     }
 
 
@@ -272,6 +542,19 @@ DEFAULT_ASSISTANT_TEMPLATE = {
     "backgroundSound": "off"
 }
 
+# Pickled once so each fresh copy is a single C-level loads instead of a deepcopy walk
+_DEFAULT_TEMPLATE_PICKLE = pickle.dumps(DEFAULT_ASSISTANT_TEMPLATE, protocol=5)
+
+
+def new_assistant_template() -> Dict:
+    """
+    Get an independent copy of DEFAULT_ASSISTANT_TEMPLATE
+    
+    Returns:
+        Assistant template dictionary that is safe to mutate
+    """
+    return pickle.loads(_DEFAULT_TEMPLATE_PICKLE)
+
 
 # Voice provider options
 VOICE_PROVIDERS = {